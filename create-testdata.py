@@ -1,9 +1,14 @@
 #!/usr/bin/env  python
 
-import random
+import io
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from faker import Faker
 from datetime import datetime
-import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 import click
 
 # Constants for Server Migration Data
@@ -48,84 +53,332 @@ TARGET_CLOUD_PROVIDERS = ["AWS", "Azure", "GCP", "OCI"]
 MIGRATION_WAVES = [1, 2, 3, 4, 5]
 BUSINESS_CRITICALITY_LEVELS = ["High", "Medium", "Low"]
 
+# NumPy views of the option lists so whole columns can be drawn in one call
+_RNG = np.random.default_rng()
+_SERVER_PREFIXES_ARR = np.array(SERVER_PREFIXES)
+_OS_TYPES_ARR = np.array(OS_TYPES)
+_CPU_CORE_OPTIONS_ARR = np.array(CPU_CORE_OPTIONS, dtype=np.int32)
+_RAM_GB_OPTIONS_ARR = np.array(RAM_GB_OPTIONS, dtype=np.int32)
+_STORAGE_GB_OPTIONS_ARR = np.array(STORAGE_GB_OPTIONS, dtype=np.int32)
+_DATACENTER_LOCATIONS_ARR = np.array(DATACENTER_LOCATIONS)
+_APPLICATION_NAMES_ARR = np.array(APPLICATION_NAMES)
+_ENVIRONMENTS_ARR = np.array(ENVIRONMENTS)
+_ENVIRONMENTS_LOWER_ARR = np.char.lower(_ENVIRONMENTS_ARR)
+_MIGRATION_STATUSES_ARR = np.array(MIGRATION_STATUSES)
+_TARGET_CLOUD_PROVIDERS_ARR = np.array(TARGET_CLOUD_PROVIDERS)
+_MIGRATION_WAVES_ARR = np.array(MIGRATION_WAVES, dtype=np.int32)
+_BUSINESS_CRITICALITY_LEVELS_ARR = np.array(BUSINESS_CRITICALITY_LEVELS)
 
-def generate_server_migration_data(num_rows, fake_instance):
+# Column types of the generated data, so Arrow tables are built without inference
+SERVER_DATA_SCHEMA = pa.schema(
+    [
+        ("server_id", pa.string()),
+        ("server_name", pa.string()),
+        ("os_type", pa.string()),
+        ("cpu_cores", pa.int32()),
+        ("ram_gb", pa.int32()),
+        ("storage_gb", pa.int32()),
+        ("ip_address", pa.string()),
+        ("datacenter_location", pa.string()),
+        ("application_name", pa.string()),
+        ("environment", pa.string()),
+        ("migration_status", pa.string()),
+        ("target_cloud_provider", pa.string()),
+        ("migration_wave", pa.int32()),
+        ("planned_migration_date", pa.string()),
+        ("business_criticality", pa.string()),
+        ("last_patch_date", pa.string()),
+    ]
+)
+
+# Header is written separately, so Arrow only formats the unquoted data rows
+_CSV_WRITE_OPTIONS = pacsv.WriteOptions(include_header=False, quoting_style="none")
+
+# Number of distinct Faker words sampled per call for the server_name column
+WORD_POOL_SIZE = 1024
+
+
+def _batch_uuid4(n, rng):
+    """
+    Generates n random (version 4) UUID strings from a single block of random bytes.
+
+    The bytes are hex-encoded in one call and sliced into the 8-4-4-4-12 layout,
+    skipping the per-call validation done by uuid.UUID.
+    """
+    raw = np.frombuffer(rng.bytes(16 * n), dtype=np.uint8).reshape(n, 16).copy()
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40  # version 4
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80  # RFC 4122 variant
+    hx = raw.tobytes().hex()
+    return [
+        f"{hx[i:i + 8]}-{hx[i + 8:i + 12]}-{hx[i + 12:i + 16]}-"
+        f"{hx[i + 16:i + 20]}-{hx[i + 20:i + 32]}"
+        for i in range(0, 32 * n, 32)
+    ]
+
+
+def _rand_idx(k, n, rng):
+    """
+    Draws n uniform indices in [0, k) using the narrowest integer dtype that fits.
+
+    Narrow bounded integers are filled from buffered 32-bit draws, which makes them
+    cheaper to produce than the default int64.
+    """
+    return rng.integers(0, k, n, dtype=np.uint8 if k <= 256 else np.int64)
+
+
+def _join_columns(sep, *columns):
+    """
+    Joins equal-length string arrays element-wise with the given separator.
+    """
+    joined = columns[0]
+    for column in columns[1:]:
+        joined = np.char.add(np.char.add(joined, sep), column)
+    return joined
+
+
+def generate_server_migration_data(num_rows, fake_instance, rng=None):
     """
     Generates synthetic server migration data.
+
+    rng is the NumPy Generator used for the vectorized columns; it defaults to the
+    shared module-level generator.
     """
+    if rng is None:
+        rng = _RNG
+    today = np.datetime64(datetime.now().date(), "D")
+    # Sample a bounded pool of words in one batched Faker call rather than one per row
+    word_pool = np.char.lower(
+        fake_instance.words(nb=max(1, min(num_rows, WORD_POOL_SIZE)))
+    )
+    octets = rng.integers(0, 256, (num_rows, 4), dtype=np.uint8).astype(str)
     data = {
-        "server_id": [fake_instance.uuid4() for _ in range(num_rows)],
-        "server_name": [
-            f"{random.choice(SERVER_PREFIXES)}-{random.choice(ENVIRONMENTS).lower()}-{fake_instance.word().lower()}-{random.randint(1, 99):02d}"
-            for _ in range(num_rows)
+        "server_id": _batch_uuid4(num_rows, rng),
+        "server_name": _join_columns(
+            "-",
+            _SERVER_PREFIXES_ARR[_rand_idx(len(SERVER_PREFIXES), num_rows, rng)],
+            _ENVIRONMENTS_LOWER_ARR[_rand_idx(len(ENVIRONMENTS), num_rows, rng)],
+            word_pool[_rand_idx(len(word_pool), num_rows, rng)],
+            np.char.mod("%02d", rng.integers(1, 100, num_rows)),
+        ),
+        "os_type": _OS_TYPES_ARR[_rand_idx(len(OS_TYPES), num_rows, rng)],
+        "cpu_cores": _CPU_CORE_OPTIONS_ARR[
+            _rand_idx(len(CPU_CORE_OPTIONS), num_rows, rng)
         ],
-        "os_type": [random.choice(OS_TYPES) for _ in range(num_rows)],
-        "cpu_cores": [random.choice(CPU_CORE_OPTIONS) for _ in range(num_rows)],
-        "ram_gb": [random.choice(RAM_GB_OPTIONS) for _ in range(num_rows)],
-        "storage_gb": [random.choice(STORAGE_GB_OPTIONS) for _ in range(num_rows)],
-        "ip_address": [fake_instance.ipv4() for _ in range(num_rows)],
-        "datacenter_location": [
-            random.choice(DATACENTER_LOCATIONS) for _ in range(num_rows)
+        "ram_gb": _RAM_GB_OPTIONS_ARR[_rand_idx(len(RAM_GB_OPTIONS), num_rows, rng)],
+        "storage_gb": _STORAGE_GB_OPTIONS_ARR[
+            _rand_idx(len(STORAGE_GB_OPTIONS), num_rows, rng)
         ],
-        "application_name": [random.choice(APPLICATION_NAMES) for _ in range(num_rows)],
-        "environment": [random.choice(ENVIRONMENTS) for _ in range(num_rows)],
-        "migration_status": [
-            random.choice(MIGRATION_STATUSES) for _ in range(num_rows)
+        "ip_address": _join_columns(".", *octets.T),
+        "datacenter_location": _DATACENTER_LOCATIONS_ARR[
+            _rand_idx(len(DATACENTER_LOCATIONS), num_rows, rng)
         ],
-        "target_cloud_provider": [
-            random.choice(TARGET_CLOUD_PROVIDERS) for _ in range(num_rows)
+        "application_name": _APPLICATION_NAMES_ARR[
+            _rand_idx(len(APPLICATION_NAMES), num_rows, rng)
         ],
-        "migration_wave": [random.choice(MIGRATION_WAVES) for _ in range(num_rows)],
-        "planned_migration_date": [
-            fake_instance.date_between(start_date="-30d", end_date="+180d").strftime(
-                "%Y-%m-%d"
-            )
-            for _ in range(num_rows)
+        "environment": _ENVIRONMENTS_ARR[_rand_idx(len(ENVIRONMENTS), num_rows, rng)],
+        "migration_status": _MIGRATION_STATUSES_ARR[
+            _rand_idx(len(MIGRATION_STATUSES), num_rows, rng)
         ],
-        "business_criticality": [
-            random.choice(BUSINESS_CRITICALITY_LEVELS) for _ in range(num_rows)
+        "target_cloud_provider": _TARGET_CLOUD_PROVIDERS_ARR[
+            _rand_idx(len(TARGET_CLOUD_PROVIDERS), num_rows, rng)
         ],
-        "last_patch_date": [
-            fake_instance.date_between(start_date="-365d", end_date="today").strftime(
-                "%Y-%m-%d"
-            )
-            for _ in range(num_rows)
+        "migration_wave": _MIGRATION_WAVES_ARR[
+            _rand_idx(len(MIGRATION_WAVES), num_rows, rng)
+        ],
+        "planned_migration_date": (
+            today + rng.integers(-30, 181, num_rows).astype("timedelta64[D]")
+        ).astype("U10"),
+        "business_criticality": _BUSINESS_CRITICALITY_LEVELS_ARR[
+            _rand_idx(len(BUSINESS_CRITICALITY_LEVELS), num_rows, rng)
         ],
+        "last_patch_date": (
+            today + rng.integers(-365, 1, num_rows).astype("timedelta64[D]")
+        ).astype("U10"),
     }
     return data
 
 
+def write_server_data_csv(server_data, csvfile, header=True):
+    """
+    Writes generated server migration columns as CSV rows to an open binary file.
+
+    Formatting is done by Arrow's C++ CSV writer. Every value comes from the fixed
+    option lists, generated ids or formatted numbers, none of which contain
+    delimiters or quotes, so fields are written unquoted.
+    """
+    if header:
+        csvfile.write((",".join(server_data) + "\n").encode("utf-8"))
+    pacsv.write_csv(
+        pa.table(server_data, schema=SERVER_DATA_SCHEMA),
+        csvfile,
+        write_options=_CSV_WRITE_OPTIONS,
+    )
+
+
+def _chunk_sizes(num_rows, chunk_rows):
+    """
+    Splits num_rows into consecutive chunk sizes of at most chunk_rows.
+
+    Always returns at least one (possibly empty) chunk so the header gets written.
+    """
+    full_chunks, remainder = divmod(num_rows, chunk_rows)
+    sizes = [chunk_rows] * full_chunks
+    if remainder or not sizes:
+        sizes.append(remainder)
+    return sizes
+
+
+def _encode_chunk(server_data, output_format, header):
+    """
+    Converts one chunk of generated columns into what the output writer consumes.
+
+    CSV chunks are formatted to bytes; Parquet chunks stay Arrow tables so each one
+    can be appended as a row group.
+    """
+    if output_format == "parquet":
+        return pa.table(server_data, schema=SERVER_DATA_SCHEMA)
+    csv_bytes = io.BytesIO()
+    write_server_data_csv(server_data, csv_bytes, header=header)
+    return csv_bytes.getvalue()
+
+
+def _write_parquet_chunks(tables, output_file):
+    """
+    Writes a stream of Arrow tables to one Snappy-compressed Parquet file.
+    """
+    writer = None
+    try:
+        for table in tables:
+            if writer is None:
+                writer = pq.ParquetWriter(
+                    output_file, table.schema, compression="snappy"
+                )
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def _gen_partition(num_rows, seed, output_format, header):
+    """
+    Generates and encodes one partition of rows in a worker process.
+
+    Each partition gets its own Faker and NumPy generator seeded from a spawned
+    SeedSequence, so forked workers never replay the parent's random state.
+    """
+    fake_instance = Faker(use_weighting=False)
+    fake_instance.seed_instance(int(seed.generate_state(1)[0]))
+    server_data = generate_server_migration_data(
+        num_rows, fake_instance, np.random.default_rng(seed)
+    )
+    return _encode_chunk(server_data, output_format, header)
+
+
+def _iter_parallel_chunks(num_rows, chunk_rows, workers, output_format, seed=None):
+    """
+    Yields encoded chunks in order, generated across worker processes.
+
+    At most two chunks per worker are in flight at once to keep memory bounded.
+    Partition seeds are spawned from seed, so a fixed seed reproduces the output.
+    """
+    # Make sure every worker gets a share even when num_rows < chunk_rows
+    chunk_rows = min(chunk_rows, max(1, -(-num_rows // workers)))
+    sizes = _chunk_sizes(num_rows, chunk_rows)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for i, (chunk_size, partition_seed) in enumerate(zip(sizes, seeds)):
+            pending.append(
+                executor.submit(
+                    _gen_partition, chunk_size, partition_seed, output_format, i == 0
+                )
+            )
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
 # Initialize Faker for realistic text data
-fake = Faker()
+fake = Faker(use_weighting=False)
 
 
 # If you want to use the server migration data generation, you can call it like this:
 # num_server_rows = 100  # Or any number of rows you need
 # server_data = generate_server_migration_data(num_server_rows, fake)
-# server_df = pd.DataFrame(server_data)
-# server_df.to_csv('server_migration_data.csv', index=False)
+# with open("server_migration_data.csv", "wb") as csvfile:
+#     write_server_data_csv(server_data, csvfile)
 # print(f"Generated {num_server_rows} rows of server migration data into server_migration_data.csv")
 @click.command()
 @click.option(
     "--num-rows",
     default=100,
     help="Number of server migration data rows to generate.",
-    type=int,
+    type=click.IntRange(min=0),
     show_default=True,
 )
 @click.option(
     "--output-file",
-    default="server_migration_data.csv",
-    help="Name of the output CSV file.",
+    default=None,
+    help="Name of the output file. Defaults to server_migration_data.csv or .parquet.",
     type=str,
+)
+@click.option(
+    "--chunk-rows",
+    default=100_000,
+    help="Number of rows generated and written per block, bounding peak memory.",
+    type=click.IntRange(min=1),
+    show_default=True,
+)
+@click.option(
+    "--workers",
+    default=1,
+    help="Number of worker processes generating chunks in parallel.",
+    type=click.IntRange(min=1),
+    show_default=True,
+)
+@click.option(
+    "--output-format",
+    default="csv",
+    help="Output file format.",
+    type=click.Choice(["csv", "parquet"]),
     show_default=True,
 )
-def cli_generate_server_data(num_rows, output_file):
-    """Generates synthetic server migration data and saves it to a CSV file."""
-    fake_instance = Faker()
-    server_data = generate_server_migration_data(num_rows, fake_instance)
-    server_df = pd.DataFrame(server_data)
-    server_df.to_csv(output_file, index=False)
+@click.option(
+    "--seed",
+    default=None,
+    help="Seed for reproducible output.",
+    type=int,
+)
+def cli_generate_server_data(
+    num_rows, output_file, chunk_rows, workers, output_format, seed
+):
+    """Generates synthetic server migration data and saves it as CSV or Parquet."""
+    if output_file is None:
+        output_file = f"server_migration_data.{output_format}"
+    if workers > 1:
+        chunks = _iter_parallel_chunks(
+            num_rows, chunk_rows, workers, output_format, seed
+        )
+    else:
+        rng = _RNG
+        if seed is not None:
+            fake.seed_instance(seed)
+            rng = np.random.default_rng(seed)
+        chunks = (
+            _encode_chunk(
+                generate_server_migration_data(chunk_size, fake, rng),
+                output_format,
+                header=i == 0,
+            )
+            for i, chunk_size in enumerate(_chunk_sizes(num_rows, chunk_rows))
+        )
+    if output_format == "parquet":
+        _write_parquet_chunks(chunks, output_file)
+    else:
+        with open(output_file, "wb", buffering=1 << 20) as csvfile:
+            for csv_bytes in chunks:
+                csvfile.write(csv_bytes)
     click.echo(f"Generated {num_rows} rows of server migration data into {output_file}")
 
 
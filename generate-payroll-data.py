@@ -1,100 +1,91 @@
 #!/usr/bin/env python3
 
-import csv
 from faker import Faker
-from datetime import datetime, timedelta
-import random
+from datetime import datetime
+from itertools import repeat, starmap
+import numpy as np
+import pandas as pd
 
+DEPARTMENTS = ["HR", "Marketing", "Sales", "IT", "Finance"]
+DEPARTMENT_WEIGHTS = [0.15, 0.2, 0.15, 0.3, 0.25]
 
-def generate_fake_payroll(filename):
-    fake = Faker()
-
-    employees = []
-    for e_id in range(1, 201):  # Generates EmployeeIDs from 1 to 200
-        dept = random.choices(
-            ["HR", "Marketing", "Sales", "IT", "Finance"],
-            weights=[0.15, 0.2, 0.15, 0.3, 0.25],
-            k=1,
-        )[0]
-        is_manager = random.random() < 0.1  # 10% chance for Manager
-
-        dept_salary_map = {
-            "HR": {"Manager": 4500, "HR Specialist": 4000},
-            "Marketing": {"Manager": 4700, "Marketer": 4600},
-            "Sales": {"Sales Rep": 5000, "Manager": 5200},
-            "IT": {"Developer": 6000, "Manager": 6100},
-            "Finance": {"Analyst": 5500, "Director": 5800},
+# (position, monthly salary) for regular staff and for management in each department
+NON_MANAGER_ROLES = {
+    "HR": ("HR Specialist", 4000),
+    "Marketing": ("Marketer", 4600),
+    "Sales": ("Sales Rep", 5000),
+    "IT": ("Developer", 6000),
+    "Finance": ("Analyst", 5500),
+}
+MANAGER_ROLES = {
+    "HR": ("Manager", 4500),
+    "Marketing": ("Manager", 4700),
+    "Sales": ("Manager", 5200),
+    "IT": ("Manager", 6100),
+    "Finance": ("Director", 5800),
+}
+
+_RNG = np.random.default_rng()
+_DEPARTMENT_P = np.array(DEPARTMENT_WEIGHTS) / sum(DEPARTMENT_WEIGHTS)
+
+# Flat position/salary lookup tables indexed by dept_idx * 2 + is_manager
+_ROLE_TABLE = [
+    role
+    for dept in DEPARTMENTS
+    for role in (NON_MANAGER_ROLES[dept], MANAGER_ROLES[dept])
+]
+_POSITION_TABLE = np.array([position for position, _ in _ROLE_TABLE])
+_SALARY_TABLE = np.array([salary for _, salary in _ROLE_TABLE])
+
+
+def _generate_records():
+    fake = Faker(use_weighting=False)
+    # Only names and emails need per-row Faker calls; bind the providers once and
+    # drive them with map/starmap instead of Python-level loops
+    first_name, last_name, email = fake.first_name, fake.last_name, fake.email
+    num_employees = 200  # Generates EmployeeIDs from 1 to 200
+
+    dept_idx = _RNG.choice(len(DEPARTMENTS), p=_DEPARTMENT_P, size=num_employees)
+    is_manager = _RNG.random(num_employees) < 0.1  # 10% chance for Manager
+    role_idx = dept_idx * 2 + is_manager
+
+    # DateOfJoining between one day and five years ago
+    today = np.datetime64(datetime.now().date(), "D")
+    days_offset = _RNG.integers(1, 5 * 365, num_employees, endpoint=True)
+
+    return pd.DataFrame(
+        {
+            "EmployeeID": np.arange(1, num_employees + 1),
+            "FullName": list(
+                map(
+                    "{} {}".format,
+                    starmap(first_name, repeat((), num_employees)),
+                    starmap(last_name, repeat((), num_employees)),
+                )
+            ),
+            "Department": np.take(DEPARTMENTS, dept_idx),
+            "Position": np.take(_POSITION_TABLE, role_idx),
+            "MonthlySalary": np.take(_SALARY_TABLE, role_idx),
+            # Hours worked per week (35-45 hours)
+            "HoursWorkedPerWeek": _RNG.integers(35, 45, num_employees, endpoint=True),
+            "DateOfJoining": (today - days_offset.astype("timedelta64[D]")).astype(
+                "U10"
+            ),
+            "EmailAddress": list(starmap(email, repeat((), num_employees))),
         }
+    )
+
 
-        # Determine position title and actual_base_salary
-        dept_roles_salaries = dept_salary_map[dept]
-        
-        if is_manager:
-            if dept == "Finance" and "Director" in dept_roles_salaries:
-                position_name = "Director"
-                actual_base_salary = dept_roles_salaries["Director"]
-            elif "Manager" in dept_roles_salaries:
-                position_name = "Manager"
-                actual_base_salary = dept_roles_salaries["Manager"]
-            else:
-                # Fallback for manager role
-                position_name = "Manager"
-                actual_base_salary = 5000
-        else:
-            # Get non-manager options
-            non_manager_options = {
-                k: v
-                for k, v in dept_roles_salaries.items()
-                if k not in ["Manager", "Director"]
-            }
-            if non_manager_options:
-                position_name = random.choice(list(non_manager_options.keys()))
-                actual_base_salary = non_manager_options[position_name]
-            else:
-                # Fallback for non-manager role
-                position_name = "Staff"
-                actual_base_salary = 3500
-
-        # Generate hours worked per week (35-45 hours)
-        hours_per_week = random.randint(35, 45)
-
-        # Generate DateOfJoining between one to five years ago
-        end_date = datetime.now()
-        total_days_in_5_years = 5 * 365
-        random_days_offset = random.randint(1, total_days_in_5_years)
-        date_of_joining = end_date - timedelta(days=random_days_offset)
-
-        email_address = fake.email()
-
-        employees.append(
-            {
-                "EmployeeID": e_id,
-                "FullName": f"{fake.first_name()} {fake.last_name()}",
-                "Department": dept,
-                "Position": position_name,
-                "MonthlySalary": actual_base_salary,
-                "HoursWorkedPerWeek": hours_per_week,
-                "DateOfJoining": date_of_joining.strftime("%Y-%m-%d"),
-                "EmailAddress": email_address,
-            }
-        )
-
-    # Write to CSV file
-    with open(filename, mode="w", newline="", encoding="utf-8") as csvfile:
-        fieldnames = [
-            "EmployeeID",
-            "FullName",
-            "Department",
-            "Position",
-            "MonthlySalary",
-            "HoursWorkedPerWeek",
-            "DateOfJoining",
-            "EmailAddress",
-        ]
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        for emp in employees:
-            writer.writerow(emp)
+def _write_csv(filename, records):
+    # Write to CSV file through a 1 MiB buffer
+    with open(
+        filename, mode="w", newline="", encoding="utf-8", buffering=1 << 20
+    ) as csvfile:
+        records.to_csv(csvfile, index=False)
+
+
+def generate_fake_payroll(filename):
+    _write_csv(filename, _generate_records())
 
 
 if __name__ == "__main__":
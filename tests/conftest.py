@@ -0,0 +1,28 @@
+import os
+import importlib.util
+
+import pytest
+
+# Import using importlib to handle hyphenated filename; done once per session here
+# rather than in every test module that needs the payroll generator
+spec = importlib.util.spec_from_file_location(
+    "generate_payroll_data",
+    os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        "generate-payroll-data.py",
+    ),
+)
+generate_payroll_data_module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(generate_payroll_data_module)
+
+
+@pytest.fixture(scope="session")
+def generate_fake_payroll():
+    """Return the payroll generator loaded from generate-payroll-data.py."""
+    return generate_payroll_data_module.generate_fake_payroll
+
+
+@pytest.fixture(scope="session")
+def generate_payroll_records():
+    """Return the in-memory payroll record builder behind generate_fake_payroll."""
+    return generate_payroll_data_module._generate_records
@@ -1,9 +1,10 @@
 import pytest
+import numpy as np
 import pandas as pd
-import tempfile
 import os
-from faker import Faker
+import csv
 from click.testing import CliRunner
+import subprocess
 import sys
 import uuid
 
@@ -13,19 +14,18 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # Import using importlib to handle hyphenated filename
 import importlib.util
 
-spec = importlib.util.spec_from_file_location(
-    "create_testdata",
-    os.path.join(
-        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-        "create-testdata.py",
-    ),
+SCRIPT_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "create-testdata.py",
 )
+spec = importlib.util.spec_from_file_location("create_testdata", SCRIPT_PATH)
 create_testdata_module = importlib.util.module_from_spec(spec)
 spec.loader.exec_module(create_testdata_module)
 
 # Extract the functions and constants we need
 generate_server_migration_data = create_testdata_module.generate_server_migration_data
 cli_generate_server_data = create_testdata_module.cli_generate_server_data
+write_server_data_csv = create_testdata_module.write_server_data_csv
 SERVER_PREFIXES = create_testdata_module.SERVER_PREFIXES
 OS_TYPES = create_testdata_module.OS_TYPES
 CPU_CORE_OPTIONS = create_testdata_module.CPU_CORE_OPTIONS
@@ -40,18 +40,28 @@ MIGRATION_WAVES = create_testdata_module.MIGRATION_WAVES
 BUSINESS_CRITICALITY_LEVELS = create_testdata_module.BUSINESS_CRITICALITY_LEVELS
 
 
+@pytest.fixture(scope="session")
+def fake():
+    """Share the script's module-level Faker instead of building one per test."""
+    return create_testdata_module.fake
+
+
 class TestGenerateServerMigrationData:
     """Test suite for server migration data generation functions."""
 
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup_fake(self, fake):
         """Set up test fixtures."""
-        self.fake = Faker()
-        self.fake.seed_instance(42)  # For reproducible tests
+        self.fake = fake
+        # For reproducible tests: Faker only supplies the word pool, every other
+        # column is drawn from the NumPy generator passed in as rng
+        self.fake.seed_instance(42)
+        self.rng = np.random.default_rng(42)
 
     def test_generate_server_migration_data_basic(self):
         """Test basic functionality of generate_server_migration_data."""
         num_rows = 10
-        data = generate_server_migration_data(num_rows, self.fake)
+        data = generate_server_migration_data(num_rows, self.fake, self.rng)
 
         # Check that we get the right number of rows
         assert len(data["server_id"]) == num_rows
@@ -83,7 +93,7 @@ class TestGenerateServerMigrationData:
     def test_generate_server_migration_data_field_values(self):
         """Test that generated data contains valid field values."""
         num_rows = 50
-        data = generate_server_migration_data(num_rows, self.fake)
+        data = generate_server_migration_data(num_rows, self.fake, self.rng)
 
         # Test that all server_ids are valid UUIDs
         for server_id in data["server_id"]:
@@ -136,7 +146,7 @@ class TestGenerateServerMigrationData:
     def test_generate_server_migration_data_server_names(self):
         """Test that server names follow the expected pattern."""
         num_rows = 20
-        data = generate_server_migration_data(num_rows, self.fake)
+        data = generate_server_migration_data(num_rows, self.fake, self.rng)
 
         for server_name in data["server_name"]:
             # Server names should contain a prefix from SERVER_PREFIXES
@@ -154,7 +164,7 @@ class TestGenerateServerMigrationData:
     def test_generate_server_migration_data_ip_addresses(self):
         """Test that IP addresses are valid."""
         num_rows = 10
-        data = generate_server_migration_data(num_rows, self.fake)
+        data = generate_server_migration_data(num_rows, self.fake, self.rng)
 
         for ip_address in data["ip_address"]:
             # Basic IP address format validation
@@ -166,7 +176,7 @@ class TestGenerateServerMigrationData:
     def test_generate_server_migration_data_dates(self):
         """Test that dates are in correct format."""
         num_rows = 10
-        data = generate_server_migration_data(num_rows, self.fake)
+        data = generate_server_migration_data(num_rows, self.fake, self.rng)
 
         # Test planned migration dates
         for date_str in data["planned_migration_date"]:
@@ -187,64 +197,191 @@ class TestGenerateServerMigrationData:
 class TestCLIInterface:
     """Test suite for the CLI interface."""
 
-    def test_cli_default_parameters(self):
+    def test_cli_default_parameters(self, tmp_path):
         """Test CLI with default parameters."""
         runner = CliRunner()
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_file = os.path.join(temp_dir, "test_output.csv")
-            result = runner.invoke(
-                cli_generate_server_data, ["--output-file", output_file]
-            )
+        output_file = tmp_path / "test_output.csv"
+        result = runner.invoke(
+            cli_generate_server_data, ["--output-file", str(output_file)]
+        )
 
-            assert result.exit_code == 0
-            assert os.path.exists(output_file)
+        assert result.exit_code == 0
+        assert output_file.exists()
 
-            # Read the generated CSV and verify structure
-            df = pd.read_csv(output_file)
-            assert len(df) == 100  # Default number of rows
-            assert len(df.columns) == 16  # Expected number of columns
+        # Read the generated CSV and verify structure
+        with open(output_file, newline="", encoding="utf-8") as csvfile:
+            reader = csv.reader(csvfile)
+            header = next(reader)
+            row_count = sum(1 for _ in reader)
+        assert row_count == 100  # Default number of rows
+        assert len(header) == 16  # Expected number of columns
 
-    def test_cli_custom_parameters(self):
+    def test_cli_custom_parameters(self, tmp_path):
         """Test CLI with custom parameters."""
         runner = CliRunner()
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_file = os.path.join(temp_dir, "custom_output.csv")
+        output_file = tmp_path / "custom_output.csv"
+        result = runner.invoke(
+            cli_generate_server_data,
+            ["--num-rows", "50", "--output-file", str(output_file)],
+        )
+
+        assert result.exit_code == 0
+        assert output_file.exists()
+
+        # Read the generated CSV and verify structure
+        with open(output_file, newline="", encoding="utf-8") as csvfile:
+            reader = csv.reader(csvfile)
+            header = next(reader)
+            row_count = sum(1 for _ in reader)
+        assert row_count == 50  # Custom number of rows
+
+        # Verify all expected columns are present
+        expected_columns = [
+            "server_id",
+            "server_name",
+            "os_type",
+            "cpu_cores",
+            "ram_gb",
+            "storage_gb",
+            "ip_address",
+            "datacenter_location",
+            "application_name",
+            "environment",
+            "migration_status",
+            "target_cloud_provider",
+            "migration_wave",
+            "planned_migration_date",
+            "business_criticality",
+            "last_patch_date",
+        ]
+
+        for col in expected_columns:
+            assert col in header
+
+    def test_cli_rejects_negative_num_rows(self, tmp_path):
+        """Test that a negative --num-rows is rejected instead of generating rows."""
+        runner = CliRunner()
+
+        output_file = tmp_path / "negative_output.csv"
+        result = runner.invoke(
+            cli_generate_server_data,
+            ["--num-rows", "-5", "--output-file", str(output_file)],
+        )
+
+        assert result.exit_code != 0
+        assert not output_file.exists()
+
+    def test_cli_chunked_output(self, tmp_path):
+        """Test that chunked generation writes one header and every requested row."""
+        runner = CliRunner()
+
+        output_file = tmp_path / "chunked_output.csv"
+        result = runner.invoke(
+            cli_generate_server_data,
+            [
+                "--num-rows",
+                "25",
+                "--chunk-rows",
+                "10",
+                "--output-file",
+                str(output_file),
+            ],
+        )
+
+        assert result.exit_code == 0
+
+        df = pd.read_csv(output_file)
+        assert len(df) == 25
+        assert len(df.columns) == 16
+        assert df["server_id"].is_unique
+
+    def test_cli_parallel_workers(self, tmp_path):
+        """Test that worker processes together yield distinct, complete rows."""
+        # Run the script itself so worker processes can import its functions from
+        # __main__ under any multiprocessing start method, including spawn
+        output_file = tmp_path / "parallel_output.csv"
+        result = subprocess.run(
+            [
+                sys.executable,
+                SCRIPT_PATH,
+                "--num-rows",
+                "40",
+                "--workers",
+                "2",
+                "--output-file",
+                str(output_file),
+            ],
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0, result.stderr
+
+        df = pd.read_csv(output_file)
+        assert len(df) == 40
+        assert len(df.columns) == 16
+        assert df["server_id"].is_unique
+
+    def test_cli_parquet_output(self, tmp_path):
+        """Test that Parquet output holds every row and column with numeric types."""
+        runner = CliRunner()
+
+        output_file = tmp_path / "parquet_output.parquet"
+        result = runner.invoke(
+            cli_generate_server_data,
+            [
+                "--num-rows",
+                "25",
+                "--chunk-rows",
+                "10",
+                "--output-format",
+                "parquet",
+                "--output-file",
+                str(output_file),
+            ],
+        )
+
+        assert result.exit_code == 0
+
+        df = pd.read_parquet(output_file)
+        assert len(df) == 25
+        assert len(df.columns) == 16
+        assert df["cpu_cores"].dtype.kind == "i"
+        assert df["server_id"].is_unique
+
+    def test_cli_parquet_default_output_file(self, tmp_path, monkeypatch):
+        """Test that Parquet output without --output-file gets a .parquet name."""
+        runner = CliRunner()
+        monkeypatch.chdir(tmp_path)
+
+        result = runner.invoke(
+            cli_generate_server_data,
+            ["--num-rows", "10", "--output-format", "parquet"],
+        )
+
+        assert result.exit_code == 0
+        assert not (tmp_path / "server_migration_data.csv").exists()
+        df = pd.read_parquet(tmp_path / "server_migration_data.parquet")
+        assert len(df) == 10
+
+    def test_cli_seed_reproducible(self, tmp_path):
+        """Test that the same --seed generates identical output."""
+        runner = CliRunner()
+
+        outputs = []
+        for name in ["first.csv", "second.csv"]:
+            output_file = tmp_path / name
             result = runner.invoke(
                 cli_generate_server_data,
-                ["--num-rows", "50", "--output-file", output_file],
+                ["--num-rows", "20", "--seed", "7", "--output-file", str(output_file)],
             )
-
             assert result.exit_code == 0
-            assert os.path.exists(output_file)
-
-            # Read the generated CSV and verify structure
-            df = pd.read_csv(output_file)
-            assert len(df) == 50  # Custom number of rows
-
-            # Verify all expected columns are present
-            expected_columns = [
-                "server_id",
-                "server_name",
-                "os_type",
-                "cpu_cores",
-                "ram_gb",
-                "storage_gb",
-                "ip_address",
-                "datacenter_location",
-                "application_name",
-                "environment",
-                "migration_status",
-                "target_cloud_provider",
-                "migration_wave",
-                "planned_migration_date",
-                "business_criticality",
-                "last_patch_date",
-            ]
-
-            for col in expected_columns:
-                assert col in df.columns
+            with open(output_file, encoding="utf-8") as csvfile:
+                outputs.append(csvfile.read())
+
+        assert outputs[0] == outputs[1]
 
     def test_cli_help(self):
         """Test CLI help output."""
@@ -255,14 +392,19 @@ class TestCLIInterface:
         assert "Generates synthetic server migration data" in result.output
         assert "--num-rows" in result.output
         assert "--output-file" in result.output
+        assert "--chunk-rows" in result.output
+        assert "--workers" in result.output
+        assert "--output-format" in result.output
+        assert "--seed" in result.output
 
 
 class TestDataIntegrity:
     """Test suite for data integrity and consistency."""
 
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup_fake(self, fake):
         """Set up test fixtures."""
-        self.fake = Faker()
+        self.fake = fake
 
     def test_data_consistency_multiple_generations(self):
         """Test that multiple generations produce consistent data structures."""
@@ -279,35 +421,41 @@ class TestDataIntegrity:
         for key in data1.keys():
             assert len(data1[key]) == len(data2[key]) == num_rows
 
-    def test_csv_output_integrity(self):
+    def test_csv_output_integrity(self, tmp_path):
         """Test that CSV output maintains data integrity."""
         num_rows = 30
-        fake_instance = Faker()
-        data = generate_server_migration_data(num_rows, fake_instance)
+        data = generate_server_migration_data(num_rows, self.fake)
         df = pd.DataFrame(data)
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".csv", delete=False
-        ) as temp_file:
-            temp_file_path = temp_file.name
-            df.to_csv(temp_file_path, index=False)
+        csv_path = tmp_path / "integrity.csv"
+        df.to_csv(csv_path, index=False)
+
+        # Read back the CSV
+        df_read = pd.read_csv(csv_path)
 
-        try:
-            # Read back the CSV
-            df_read = pd.read_csv(temp_file_path)
+        # Verify the data integrity
+        assert len(df_read) == num_rows
+        assert list(df_read.columns) == list(df.columns)
 
-            # Verify the data integrity
-            assert len(df_read) == num_rows
-            assert list(df_read.columns) == list(df.columns)
+        # Verify no null values in critical fields
+        critical_fields = ["server_id", "server_name", "os_type"]
+        for field in critical_fields:
+            assert df_read[field].isnull().sum() == 0
+
+    def test_write_server_data_csv_round_trip(self, tmp_path):
+        """Test that the CSV writer output reads back to the generated values."""
+        num_rows = 30
+        data = generate_server_migration_data(num_rows, self.fake)
 
-            # Verify no null values in critical fields
-            critical_fields = ["server_id", "server_name", "os_type"]
-            for field in critical_fields:
-                assert df_read[field].isnull().sum() == 0
+        output_file = tmp_path / "round_trip.csv"
+        with open(output_file, "wb") as csvfile:
+            write_server_data_csv(data, csvfile)
+        df_read = pd.read_csv(output_file, dtype=str)
 
-        finally:
-            # Clean up
-            os.unlink(temp_file_path)
+        assert list(df_read.columns) == list(data.keys())
+        assert len(df_read) == num_rows
+        for field, values in data.items():
+            assert df_read[field].tolist() == [str(value) for value in values]
 
 
 if __name__ == "__main__":